@@ -209,19 +209,17 @@ def generate_presentation(topic, slide_count, include_real_data, template_key):
         
         # Ensure template_key is properly formatted
         formatted_template = template_key.lower().replace(" ", "_")
-        ppt_bytes = ppt_generator.create_presentation(
-            content=content,
-            template=formatted_template
-        )
-        
-        if not ppt_bytes:
-            st.error("Failed to create PowerPoint file. Please try again.")
-            return
         
         # Sanitize topic for filename (remove newlines, invalid chars, replace spaces)
         sanitized_topic = topic.strip().replace('\n', '').replace('\r', '').replace(' ', '_').replace('/', '_').replace('\\', '_').replace(':', '_').replace('*', '_').replace('?', '_').replace('"', '_').replace('<', '_').replace('>', '_').replace('|', '_')
         filename = f"{sanitized_topic}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pptx"
-        ppt_file = ppt_generator.save_presentation(ppt_bytes, filename)
+        
+        # Stream the deck straight to disk instead of buffering it in memory first
+        ppt_file = ppt_generator.create_presentation(
+            content=content,
+            template=formatted_template,
+            output=ppt_generator.get_output_path(filename)
+        )
         
         # Step 3: Complete
         status_text.text("✅ Presentation ready!")
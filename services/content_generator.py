@@ -57,15 +57,16 @@ class FinancialContentGenerator:
         }
         self.market_data_service = market_data_service
 
+    def warmup(self) -> None:
+        """Prime the shared SerpAPI connection pool before generating content"""
+        serpapi_service.warmup()
+
     def generate_presentation_content(self, topic: str, presentation_type: str, target_audience: str, slide_count: int, include_real_data: bool, content_provider: str) -> Dict[str, Any]:
         """Generate presentation content using SerpAPI for factual data with visual suggestions"""
         if content_provider != "SerpAPI":
             # Fallback to old AI method if needed
             return self._get_fallback_content(topic, presentation_type, target_audience, slide_count)
         
-        # Use SerpAPI for real data
-        search_results = serpapi_service.search_financial_topic(topic, num_results=15)
-        
         # Get templates
         templates = self.financial_templates.get(presentation_type, self.financial_templates["quarterly_analysis"])
         slide_titles = templates["slides"][:slide_count]
@@ -79,10 +80,18 @@ class FinancialContentGenerator:
             if symbols:
                 market_data = self.market_data_service.get_comprehensive_analysis(symbols[0])  # Use first symbol
         
+        # Visual suggestions depend only on the title and market data, so every
+        # slide's content search and image search can be issued up front at once
+        slide_searches = [f"{topic} {title}" for title in slide_titles]
+        visual_suggestions = [self._get_visual_suggestion(title, market_data, topic) for title in slide_titles]
+        image_queries = [f"{vs['image_description']} finance {topic}" for vs in visual_suggestions]
+        search_results, image_results = serpapi_service.search_many(
+            slide_searches, num_results=5, image_queries=image_queries, num_images=1
+        )
+        
         for i, title in enumerate(slide_titles):
-            # Search for slide-specific content
-            slide_search = f"{topic} {title}"
-            slide_results = serpapi_service.search_financial_topic(slide_search, num_results=5)
+            # Slide-specific content
+            slide_results = search_results[slide_searches[i]]
             
             bullets = serpapi_service.extract_bullet_points(slide_results, title)
             
@@ -91,11 +100,10 @@ class FinancialContentGenerator:
                 bullets.append(f"• Additional insight on {title.lower()}")
             bullets = bullets[:6]  # Limit to max 6
             
-            visual_suggestion = self._get_visual_suggestion(title, market_data, topic)
+            visual_suggestion = visual_suggestions[i]
             
-            # Search for relevant image
-            image_query = f"{visual_suggestion['image_description']} finance {topic}"
-            image_urls = serpapi_service.search_images(image_query, num_results=1)
+            # Relevant image
+            image_urls = image_results[image_queries[i]]
             if image_urls:
                 visual_suggestion["image_url"] = image_urls[0]
             
@@ -1,165 +1,366 @@
+import pptx
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+import copy
 import io
+import re
 import base64
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union, BinaryIO
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from xml.sax.saxutils import escape as xml_escape
+from concurrent.futures import ThreadPoolExecutor
 import os
+import requests
+from requests.adapters import HTTPAdapter
+
+# python-pptx's stock template, read once so each deck starts from memory
+# instead of reopening the file on disk
+with open(os.path.join(os.path.dirname(pptx.__file__), "templates", "default.pptx"), "rb") as _f:
+    _BASE_PPTX_BYTES = _f.read()
+del _f
+
+# Font sizes and offsets are built once at import time; Length values are
+# immutable ints, so every slide can share the same instances.
+_PT_SIZES = {size: Pt(size) for size in (10, 12, 14, 16, 18, 20, 24, 32, 44, 48)}
+_INCHES = {
+    value: Inches(value)
+    for value in (0, 0.05, 0.3, 0.5, 1.3, 1.5, 2, 2.33, 2.5, 3, 3.33, 3.5,
+                  4, 4.2, 4.5, 5, 5.8, 6, 7.5, 8, 9, 13.33)
+}
+_CAPTION_GRAY_HEX = "808080"
+
+# Downloaded images kept in memory per generator (originals can be several MB)
+_IMAGE_CACHE_SIZE = 32
+_IMAGE_FETCH_WORKERS = 16
+
+# Decks are written to disk through a 1 MiB buffer instead of the 8 KiB default
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Fallback copy for the summary and appendix slides
+_DEFAULT_RECOMMENDATIONS = (
+    "Strategic recommendation based on analysis",
+    "Operational improvement opportunity",
+    "Risk mitigation strategy"
+)
+_DEFAULT_STEPS = (
+    "Review and validate findings",
+    "Implement priority recommendations",
+    "Monitor key performance indicators",
+    "Schedule follow-up analysis"
+)
+_DEFAULT_APPENDIX = (
+    "Detailed financial models and assumptions",
+    "Supporting market research and analysis",
+    "Risk assessment matrices and scenarios",
+    "Additional data sources and methodology"
+)
+
+# Leading bullet glyphs/whitespace that AI and search content tends to prepend
+_BULLET_RE = re.compile(r'^[\s•\-*]+')
+_LINE_BREAK_RE = re.compile("\n|\v")
+# XML-illegal control characters, escaped as "_xHHHH_" like CT_RegularTextRun.text does
+_CTRL_CHAR_RE = re.compile(r"[\x00-\x08\x0B-\x1F]")
+
+
+@lru_cache(maxsize=64)
+def _default_run_properties_xml(name: str, size, color_hex: str, bold: Optional[bool]) -> str:
+    """Serialize the <a:defRPr> that paragraph.font would write for this style"""
+    bold_attr = "" if bold is None else f' b="{int(bold)}"'
+    return (
+        f'<a:defRPr sz="{size.centipoints}"{bold_attr}>'
+        f'<a:solidFill><a:srgbClr val="{color_hex}"/></a:solidFill>'
+        f'<a:latin typeface="{name}"/>'
+        f'</a:defRPr>'
+    )
+
+
+@lru_cache(maxsize=64)
+def _default_run_properties(name: str, size, color_hex: str, bold: Optional[bool]):
+    """Parse (once per style) the <a:defRPr> prototype used by _apply_para_style"""
+    pPr = parse_xml(f'<a:pPr {nsdecls("a")}>{_default_run_properties_xml(name, size, color_hex, bold)}</a:pPr>')
+    return pPr[0]
+
+
+def _apply_para_style(paragraph, name: str, size, color_hex: str,
+                      align=None, bold: Optional[bool] = None, level: Optional[int] = None):
+    """Style a paragraph with one XML insert instead of a chain of font property setters"""
+    pPr = paragraph._p.get_or_add_pPr()
+    pPr._remove_defRPr()
+    pPr.insert_element_before(
+        copy.deepcopy(_default_run_properties(name, size, color_hex, bold)), "a:extLst"
+    )
+    if align is not None:
+        pPr.algn = align
+    if level is not None:
+        pPr.lvl = level
+
+
+def _escape_ctrl_chars(text: str) -> str:
+    """Replace control characters the way python-pptx run text does (BEL becomes _x0007_)"""
+    return _CTRL_CHAR_RE.sub(lambda match: "_x%04X_" % ord(match.group()), text)
+
+
+def _runs_xml(text: str) -> str:
+    """Serialize text the way a:p.append_text() does: line breaks become <a:br/>, empty runs are dropped"""
+    return "<a:br/>".join(
+        f"<a:r><a:t>{xml_escape(_escape_ctrl_chars(part))}</a:t></a:r>" if part else ""
+        for part in _LINE_BREAK_RE.split(text)
+    )
+
+
+def _paragraphs_xml(lines, name: str, size, color_hex: str,
+                    align=None, bold: Optional[bool] = None) -> str:
+    """Serialize one identically styled paragraph per line"""
+    algn_attr = "" if align is None else f' algn="{PP_ALIGN.to_xml(align)}"'
+    pPr_xml = f"<a:pPr{algn_attr}>{_default_run_properties_xml(name, size, color_hex, bold)}</a:pPr>"
+    return "".join(f"<a:p>{pPr_xml}{_runs_xml(line)}</a:p>" for line in lines)
+
+
+def _plain_paragraphs_xml(lines) -> str:
+    """Serialize one unstyled paragraph per line (styling comes from the list style)"""
+    return "".join(f"<a:p>{_runs_xml(line)}</a:p>" for line in lines)
+
+
+def _set_list_style(text_frame, name: str, size, color_hex: str, bold: Optional[bool] = None):
+    """Style every top-level paragraph of a text frame once via a:lstStyle/a:lvl1pPr"""
+    txBody = text_frame._txBody
+    lstStyle = parse_xml(
+        f'<a:lstStyle {nsdecls("a")}><a:lvl1pPr>'
+        f'{_default_run_properties_xml(name, size, color_hex, bold)}'
+        f'</a:lvl1pPr></a:lstStyle>'
+    )
+    old_lstStyle = txBody.find(qn("a:lstStyle"))
+    if old_lstStyle is not None:
+        txBody.replace(old_lstStyle, lstStyle)
+    else:
+        txBody.bodyPr.addnext(lstStyle)
+
+
+def _extend_text_frame(text_frame, paragraphs_xml: str):
+    """Append serialized paragraphs to a text frame with a single XML parse
+
+    The lone empty paragraph of a new or cleared text frame is replaced rather
+    than kept as a blank first line.
+    """
+    if not paragraphs_xml:
+        return
+    txBody = text_frame._txBody
+    p_lst = txBody.p_lst
+    if len(p_lst) == 1 and len(p_lst[0]) == 0:
+        txBody.remove(p_lst[0])
+    txBody.extend(parse_xml(f'<a:txBody {nsdecls("a")}>{paragraphs_xml}</a:txBody>'))
+
+
+_TEMPLATES = {
+    "corporate_blue": {
+        "primary_color": RGBColor(31, 78, 121),      # #1f4e79
+        "secondary_color": RGBColor(74, 144, 226),    # #4a90e2
+        "accent_color": RGBColor(123, 179, 240),      # #7bb3f0
+        "text_color": RGBColor(51, 51, 51),          # #333333
+        "background_color": RGBColor(255, 255, 255),  # #ffffff
+        "success_color": RGBColor(40, 167, 69),       # #28a745
+        "warning_color": RGBColor(255, 193, 7),       # #ffc107
+        "danger_color": RGBColor(220, 53, 69)         # #dc3545
+    },
+    "financial_green": {
+        "primary_color": RGBColor(45, 90, 39),        # #2d5a27
+        "secondary_color": RGBColor(76, 175, 80),     # #4caf50
+        "accent_color": RGBColor(129, 199, 132),      # #81c784
+        "text_color": RGBColor(51, 51, 51),          # #333333
+        "background_color": RGBColor(255, 255, 255),  # #ffffff
+        "success_color": RGBColor(102, 187, 106),     # #66bb6a
+        "warning_color": RGBColor(255, 152, 0),       # #ff9800
+        "danger_color": RGBColor(244, 67, 54)         # #f44336
+    },
+    "modern_orange": {
+        "primary_color": RGBColor(230, 81, 0),        # #e65100
+        "secondary_color": RGBColor(255, 152, 0),     # #ff9800
+        "accent_color": RGBColor(255, 183, 77),       # #ffb74d
+        "text_color": RGBColor(51, 51, 51),          # #333333
+        "background_color": RGBColor(255, 255, 255),  # #ffffff
+        "success_color": RGBColor(76, 175, 80),       # #4caf50
+        "warning_color": RGBColor(255, 193, 7),       # #ffc107
+        "danger_color": RGBColor(244, 67, 54)         # #f44336
+    },
+    "colorful_modern": {
+        "bar_colors": (
+            RGBColor(220, 53, 69),   # Red for D
+            RGBColor(255, 99, 132),  # Pink for C
+            RGBColor(40, 167, 69),   # Green for B
+            RGBColor(255, 193, 7)    # Yellow/Beige for A
+        ),
+        "letter_color": RGBColor(255, 255, 255),  # White letters
+        "title_color": RGBColor(0, 0, 0),  # Black title
+        "primary_color": RGBColor(0, 0, 0),  # Black slide titles
+        "text_color": RGBColor(51, 51, 51),  # #333333 body text
+        "background_color": RGBColor(255, 255, 255)  # White background
+    },
+    "modern_white": {
+        "primary_color": RGBColor(0, 51, 102),        # #003366
+        "secondary_color": RGBColor(173, 216, 230),   # #add8e6
+        "accent_color": RGBColor(240, 248, 255),      # #f0f8ff
+        "text_color": RGBColor(51, 51, 51),          # #333333
+        "background_color": RGBColor(255, 255, 255),  # #ffffff
+        "success_color": RGBColor(144, 238, 144),     # #90ee90
+        "warning_color": RGBColor(255, 228, 196),     # #ffe4c4
+        "danger_color": RGBColor(255, 182, 193)       # #ffb6c1
+    },
+    "executive_dark": {
+        "primary_color": RGBColor(25, 25, 25),        # #191919
+        "secondary_color": RGBColor(64, 64, 64),      # #404040
+        "accent_color": RGBColor(105, 105, 105),      # #696969
+        "text_color": RGBColor(255, 255, 255),        # #ffffff
+        "background_color": RGBColor(18, 18, 18),     # #121212
+        "success_color": RGBColor(76, 175, 80),       # #4caf50
+        "warning_color": RGBColor(255, 193, 7),       # #ffc107
+        "danger_color": RGBColor(244, 67, 54)         # #f44336
+    }
+}
+
+# srgbClr hex strings for each template color, e.g. colors["_hex"]["primary"] == "1F4E79"
+for _template in _TEMPLATES.values():
+    _template["_hex"] = {
+        key[:-len("_color")]: str(color)
+        for key, color in _template.items()
+        if key.endswith("_color") and isinstance(color, RGBColor)
+    }
+del _template
+
+# Shared by every generator instance; read-only so no caller can alter a theme
+_TEMPLATES = MappingProxyType({
+    name: MappingProxyType(template) for name, template in _TEMPLATES.items()
+})
+
 
 class ProfessionalPPTGenerator:
     """Generate professional PowerPoint presentations with Gamma AI-level quality"""
     
+    templates = _TEMPLATES
+    
     def __init__(self):
-        self.templates = {
-            "corporate_blue": {
-                "primary_color": RGBColor(31, 78, 121),      # #1f4e79
-                "secondary_color": RGBColor(74, 144, 226),    # #4a90e2
-                "accent_color": RGBColor(123, 179, 240),      # #7bb3f0
-                "text_color": RGBColor(51, 51, 51),          # #333333
-                "background_color": RGBColor(255, 255, 255),  # #ffffff
-                "success_color": RGBColor(40, 167, 69),       # #28a745
-                "warning_color": RGBColor(255, 193, 7),       # #ffc107
-                "danger_color": RGBColor(220, 53, 69)         # #dc3545
-            },
-            "financial_green": {
-                "primary_color": RGBColor(45, 90, 39),        # #2d5a27
-                "secondary_color": RGBColor(76, 175, 80),     # #4caf50
-                "accent_color": RGBColor(129, 199, 132),      # #81c784
-                "text_color": RGBColor(51, 51, 51),          # #333333
-                "background_color": RGBColor(255, 255, 255),  # #ffffff
-                "success_color": RGBColor(102, 187, 106),     # #66bb6a
-                "warning_color": RGBColor(255, 152, 0),       # #ff9800
-                "danger_color": RGBColor(244, 67, 54)         # #f44336
-            },
-            "modern_orange": {
-                "primary_color": RGBColor(230, 81, 0),        # #e65100
-                "secondary_color": RGBColor(255, 152, 0),     # #ff9800
-                "accent_color": RGBColor(255, 183, 77),       # #ffb74d
-                "text_color": RGBColor(51, 51, 51),          # #333333
-                "background_color": RGBColor(255, 255, 255),  # #ffffff
-                "success_color": RGBColor(76, 175, 80),       # #4caf50
-                "warning_color": RGBColor(255, 193, 7),       # #ffc107
-                "danger_color": RGBColor(244, 67, 54)         # #f44336
-            },
-            "colorful_modern": {
-                "bar_colors": [
-                    RGBColor(220, 53, 69),   # Red for D
-                    RGBColor(255, 99, 132),  # Pink for C
-                    RGBColor(40, 167, 69),   # Green for B
-                    RGBColor(255, 193, 7)    # Yellow/Beige for A
-                ],
-                "letter_color": RGBColor(255, 255, 255),  # White letters
-                "title_color": RGBColor(0, 0, 0),  # Black title
-                "background_color": RGBColor(255, 255, 255)  # White background
-            },
-            "modern_white": {
-                "primary_color": RGBColor(0, 51, 102),        # #003366
-                "secondary_color": RGBColor(173, 216, 230),   # #add8e6
-                "accent_color": RGBColor(240, 248, 255),      # #f0f8ff
-                "text_color": RGBColor(51, 51, 51),          # #333333
-                "background_color": RGBColor(255, 255, 255),  # #ffffff
-                "success_color": RGBColor(144, 238, 144),     # #90ee90
-                "warning_color": RGBColor(255, 228, 196),     # #ffe4c4
-                "danger_color": RGBColor(255, 182, 193)       # #ffb6c1
-            },
-            "executive_dark": {
-                "primary_color": RGBColor(25, 25, 25),        # #191919
-                "secondary_color": RGBColor(64, 64, 64),      # #404040
-                "accent_color": RGBColor(105, 105, 105),      # #696969
-                "text_color": RGBColor(255, 255, 255),        # #ffffff
-                "background_color": RGBColor(18, 18, 18),     # #121212
-                "success_color": RGBColor(76, 175, 80),       # #4caf50
-                "warning_color": RGBColor(255, 193, 7),       # #ffc107
-                "danger_color": RGBColor(244, 67, 54)         # #f44336
-            }
+        # Keep-alive pool sized to the prefetch workers so concurrent downloads
+        # from the same image CDN reuse connections instead of re-handshaking
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_IMAGE_FETCH_WORKERS, pool_maxsize=_IMAGE_FETCH_WORKERS)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Slides often reuse the same stock image URL; download each one once
+        self._fetch_image_bytes = lru_cache(maxsize=_IMAGE_CACHE_SIZE)(self._download_image)
+        # Templates with a custom title slide; all others use _create_title_slide
+        self._title_builders = {
+            "colorful_modern": self._create_colorful_title_slide
         }
     
     def create_presentation(self, 
                           content: Dict[str, Any], 
-                          template: str = "corporate_blue") -> bytes:
-        """Create a complete professional presentation"""
-        
-        prs = Presentation()
+                          template: str = "corporate_blue",
+                          output: Optional[Union[str, os.PathLike, BinaryIO]] = None,
+                          as_view: bool = False) -> Union[bytes, memoryview, str, os.PathLike, BinaryIO]:
+        """Create a complete professional presentation
+
+        When ``output`` (a path or writable binary file) is given the deck is
+        streamed straight into it and ``output`` is returned; otherwise the
+        serialized deck is returned as bytes. Pass ``as_view=True`` to get a
+        read-only memoryview over the save buffer instead of a copy, e.g. to
+        hand straight to ``save_presentation``.
+        """
+        
+        prs = Presentation(io.BytesIO(_BASE_PPTX_BYTES))
         colors = self.templates[template]
         
         # Set slide size to widescreen (16:9)
-        prs.slide_width = Inches(13.33)
-        prs.slide_height = Inches(7.5)
+        prs.slide_width = _INCHES[13.33]
+        prs.slide_height = _INCHES[7.5]
+        
+        # Set the background once on the slide master; every layout and slide inherits it
+        fill = prs.slide_master.background.fill
+        fill.solid()
+        fill.fore_color.rgb = colors["background_color"]
+        
+        # Format the deck date once so every slide shows the same value
+        date_str = datetime.now().strftime('%B %Y')
+        slides = content.get("slides") or []
         
         # Create title slide
-        self._create_title_slide(prs, content, colors)
+        title_builder = self._title_builders.get(template, self._create_title_slide)
+        title_builder(prs, content, colors, date_str)
         
         # Create agenda slide
-        self._create_agenda_slide(prs, content, colors)
+        self._create_agenda_slide(prs, content, colors, slides)
         
-        # Create content slides
-        for slide_data in content.get("slides", []):
-            self._create_content_slide(prs, slide_data, colors)
+        # Download every slide image concurrently before building slides
+        images = self._prefetch_images(slides)
         
-        # Save to bytes
+        # Create content slides
+        for slide_data in slides:
+            self._create_content_slide(prs, slide_data, colors, images)
+        
+        # python-pptx already writes every package part with ZIP_DEFLATED at
+        # zlib's default level (6), so the saved zip needs no re-pack here.
+        if output is not None:
+            if isinstance(output, (str, os.PathLike)):
+                # Open outside the try: if open() fails, whatever is already at output is left alone
+                f = open(output, "wb", buffering=_WRITE_BUFFER_SIZE)
+                try:
+                    with f:
+                        prs.save(f)
+                except (Exception, KeyboardInterrupt):
+                    # Don't leave a truncated .pptx behind for a failed save
+                    try:
+                        os.remove(output)
+                    except OSError:
+                        pass
+                    raise
+            else:
+                prs.save(output)
+            return output
+        
+        # Save to memory
         ppt_io = io.BytesIO()
         prs.save(ppt_io)
-        ppt_io.seek(0)
         
+        if as_view:
+            # Zero-copy view of the buffer for callers that only write it out
+            return ppt_io.getbuffer().toreadonly()
         return ppt_io.getvalue()
     
-    def _create_title_slide(self, prs, content: Dict, colors: Dict):
+    def _create_title_slide(self, prs, content: Dict, colors: Dict, date_str: str):
         """Create professional title slide"""
         slide_layout = prs.slide_layouts[0]  # Title slide layout
         slide = prs.slides.add_slide(slide_layout)
         
-        if "colorful_modern" in colors:
-            # Custom colorful modern template
-            self._create_colorful_title_slide(prs, slide, content, colors)
-        else:
-            # Original templates
-            # Set background color
-            background = slide.background
-            fill = background.fill
-            fill.solid()
-            fill.fore_color.rgb = colors["background_color"]
-            
-            # Title
-            title = slide.shapes.title
-            title.text = content.get("presentation_title", "Financial Analysis")
-            title_frame = title.text_frame
-            title_para = title_frame.paragraphs[0]
-            title_para.font.name = "Calibri"
-            title_para.font.size = Pt(44)
-            title_para.font.color.rgb = colors["primary_color"]
-            title_para.font.bold = True
-            title_para.alignment = PP_ALIGN.CENTER
-            
-            # Subtitle
-            subtitle = slide.placeholders[1]
-            subtitle.text = f"Professional Financial Presentation\n{datetime.now().strftime('%B %Y')}"
-            subtitle_frame = subtitle.text_frame
-            for para in subtitle_frame.paragraphs:
-                para.font.name = "Calibri"
-                para.font.size = Pt(24)
-                para.font.color.rgb = colors["secondary_color"]
-                para.alignment = PP_ALIGN.CENTER
-            
-
-    def _create_colorful_title_slide(self, prs, slide, content: Dict, colors: Dict):
+        # Title
+        title = slide.shapes.title
+        title.text = content.get("presentation_title", "Financial Analysis")
+        title_frame = title.text_frame
+        title_para = title_frame.paragraphs[0]
+        _apply_para_style(title_para, "Calibri", _PT_SIZES[44], colors["_hex"]["primary"], align=PP_ALIGN.CENTER, bold=True)
+        
+        # Subtitle
+        subtitle = slide.placeholders[1]
+        subtitle.text = f"Professional Financial Presentation\n{date_str}"
+        subtitle_frame = subtitle.text_frame
+        for para in subtitle_frame.paragraphs:
+            _apply_para_style(para, "Calibri", _PT_SIZES[24], colors["_hex"]["secondary"], align=PP_ALIGN.CENTER)
+    
+    def _create_colorful_title_slide(self, prs, content: Dict, colors: Dict, date_str: str):
         """Create colorful modern title slide with vertical bars and letters"""
-        # Clear default layout elements
-        for shape in slide.shapes:
-            shape.element.getparent().remove(shape.element)
-        
-        # Set white background
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = colors["background_color"]
+        # Blank layout - this slide draws all of its own shapes, so there are
+        # no title/subtitle placeholders to create and then strip again
+        slide_layout = prs.slide_layouts[6]
+        slide = prs.slides.add_slide(slide_layout)
         
         # Create 4 vertical bars on left (each 1/4 of slide width, full height)
-        bar_width = Inches(3.33)  # 1/4 of 13.33 inches
-        bar_height = Inches(7.5)  # Full height
-        bar_x_start = Inches(0)
+        bar_width = _INCHES[3.33]  # 1/4 of 13.33 inches
+        bar_height = _INCHES[7.5]  # Full height
+        bar_x_start = _INCHES[0]
         
         letters = ['D', 'C', 'B', 'A']
         bar_colors = colors["bar_colors"]
@@ -171,7 +372,7 @@ class ProfessionalPPTGenerator:
             # Create bar rectangle
             bar_shape = slide.shapes.add_shape(
                 MSO_SHAPE.RECTANGLE,
-                bar_x, Inches(0), bar_width, bar_height
+                bar_x, _INCHES[0], bar_width, bar_height
             )
             bar_shape.fill.solid()
             bar_shape.fill.fore_color.rgb = bar_color
@@ -179,56 +380,39 @@ class ProfessionalPPTGenerator:
             
             # Add letter overlay (centered vertically and horizontally in bar)
             letter_shape = slide.shapes.add_textbox(
-                bar_x + Inches(0.5), Inches(3), Inches(2.33), Inches(1.5)
+                bar_x + _INCHES[0.5], _INCHES[3], _INCHES[2.33], _INCHES[1.5]
             )
             letter_frame = letter_shape.text_frame
             letter_frame.clear()
             letter_para = letter_frame.add_paragraph()
             letter_para.text = letter
-            letter_para.font.name = "Arial Black"
-            letter_para.font.size = Pt(48)
-            letter_para.font.color.rgb = colors["letter_color"]
-            letter_para.font.bold = True
-            letter_para.alignment = PP_ALIGN.CENTER
+            _apply_para_style(letter_para, "Arial Black", _PT_SIZES[48], colors["_hex"]["letter"], align=PP_ALIGN.CENTER, bold=True)
             letter_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
         
         # Title on right side
-        title_x = Inches(4)
+        title_x = _INCHES[4]
         title_shape = slide.shapes.add_textbox(
-            title_x, Inches(1.5), Inches(9), Inches(2)
+            title_x, _INCHES[1.5], _INCHES[9], _INCHES[2]
         )
         title_frame = title_shape.text_frame
         title_para = title_frame.add_paragraph()
         title_para.text = content.get("presentation_title", "Financial Analysis")
-        title_para.font.name = "Calibri"
-        title_para.font.size = Pt(44)
-        title_para.font.color.rgb = colors["title_color"]
-        title_para.font.bold = True
-        title_para.alignment = PP_ALIGN.LEFT
+        _apply_para_style(title_para, "Calibri", _PT_SIZES[44], colors["_hex"]["title"], align=PP_ALIGN.LEFT, bold=True)
         
         # Subtitle below title
         subtitle_shape = slide.shapes.add_textbox(
-            title_x, Inches(3.5), Inches(9), Inches(1.5)
+            title_x, _INCHES[3.5], _INCHES[9], _INCHES[1.5]
         )
         subtitle_frame = subtitle_shape.text_frame
         subtitle_para = subtitle_frame.add_paragraph()
-        subtitle_para.text = f"Professional Financial Presentation\n{datetime.now().strftime('%B %Y')}"
-        subtitle_para.font.name = "Calibri"
-        subtitle_para.font.size = Pt(24)
-        subtitle_para.font.color.rgb = colors["title_color"]
-        subtitle_para.alignment = PP_ALIGN.LEFT
+        subtitle_para.text = f"Professional Financial Presentation\n{date_str}"
+        _apply_para_style(subtitle_para, "Calibri", _PT_SIZES[24], colors["_hex"]["title"], align=PP_ALIGN.LEFT)
     
-    def _create_agenda_slide(self, prs, content: Dict, colors: Dict):
+    def _create_agenda_slide(self, prs, content: Dict, colors: Dict, slides: List[Dict]):
         """Create agenda/outline slide"""
         slide_layout = prs.slide_layouts[1]  # Title and content layout
         slide = prs.slides.add_slide(slide_layout)
         
-        # Set background
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = colors["background_color"]
-        
         # Title
         title = slide.shapes.title
         title.text = "Agenda"
@@ -240,147 +424,143 @@ class ProfessionalPPTGenerator:
         text_frame.clear()
         
         # Add agenda items from slides
-        slides_data = content.get("slides", [])
-        for i, slide_data in enumerate(slides_data[:8]):  # Limit to 8 items
-            p = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
-            p.text = f"{i+1}. {slide_data.get('title', f'Section {i+1}')}"
-            p.font.name = "Calibri"
-            p.font.size = Pt(20)
-            p.font.color.rgb = colors["text_color"]
-            p.level = 0
+        agenda_items = [
+            f"{i+1}. {slide_data.get('title', f'Section {i+1}')}"
+            for i, slide_data in zip(range(8), slides)  # Limit to 8 items
+        ]
+        # Style is set once on the frame's list style; items only carry text
+        _set_list_style(text_frame, "Calibri", _PT_SIZES[20], colors["_hex"]["text"])
+        _extend_text_frame(text_frame, _plain_paragraphs_xml(agenda_items))
         
         # Add executive summary - repositioned to avoid overlap
         if content.get("executive_summary"):
             summary_box = slide.shapes.add_textbox(
-                Inches(0.5), Inches(5), Inches(6), Inches(2)
+                _INCHES[0.5], _INCHES[5], _INCHES[6], _INCHES[2]
             )
             summary_frame = summary_box.text_frame
             summary_para = summary_frame.paragraphs[0]
             summary_para.text = "Executive Summary"
-            summary_para.font.name = "Calibri"
-            summary_para.font.size = Pt(16)
-            summary_para.font.color.rgb = colors["primary_color"]
-            summary_para.font.bold = True
+            _apply_para_style(summary_para, "Calibri", _PT_SIZES[16], colors["_hex"]["primary"], bold=True)
             
             summary_content = summary_frame.add_paragraph()
             summary_content.text = content["executive_summary"][:100] + "..."  # Truncate to fit
-            summary_content.font.name = "Calibri"
-            summary_content.font.size = Pt(12)
-            summary_content.font.color.rgb = colors["text_color"]
+            _apply_para_style(summary_content, "Calibri", _PT_SIZES[12], colors["_hex"]["text"])
     
-    def _create_content_slide(self, prs, slide_data: Dict, colors: Dict):
+    def _create_content_slide(self, prs, slide_data: Dict, colors: Dict,
+                              images: Optional[Dict[str, Optional[bytes]]] = None):
         """Create individual content slide"""
         slide_layout = prs.slide_layouts[1]  # Title and content layout
         slide = prs.slides.add_slide(slide_layout)
         
-        # Set background
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = colors["background_color"]
-        
         # Title
         title = slide.shapes.title
         title.text = slide_data.get("title", "Content Slide")
         self._format_slide_title(title, colors)
         
         # Main content area - wider left side for better text visibility
-        content_left = Inches(0.3)
-        content_top = Inches(1.3)
-        content_width = Inches(7.5)  # Wider for text dominance
-        content_height = Inches(5.8)  # Taller
+        content_left = _INCHES[0.3]
+        content_top = _INCHES[1.3]
+        content_width = _INCHES[7.5]  # Wider for text dominance
+        content_height = _INCHES[5.8]  # Taller
         
         content_box = slide.shapes.add_textbox(content_left, content_top, content_width, content_height)
         text_frame = content_box.text_frame
         text_frame.clear()
         text_frame.word_wrap = True  # Ensure wrapping
         
-        # Add bullet points - strip existing bullets, no level for clean bullets
-        content_items = slide_data.get("content", [])
-        for i, item in enumerate(content_items):
-            # Thorough stripping of bullets/symbols
-            clean_item = item.lstrip("• ").lstrip("•").lstrip("- ").lstrip("-").lstrip("* ").lstrip("*").strip()
-            p = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
-            p.text = f"• {clean_item}"  # Manually add single bullet
-            p.font.name = "Calibri"
-            p.font.size = Pt(18)  # Slightly smaller for fit
-            p.font.color.rgb = colors["text_color"]
-            p.alignment = PP_ALIGN.LEFT
-            p.level = 0  # No auto-bullets
-        
-        # Add data points if available - as sub-items without double bullets
-        data_points = slide_data.get("data_points", [])
-        if data_points:
-            for data_point in data_points:
-                clean_dp = data_point.lstrip("• ").lstrip("•").lstrip("- ").lstrip("-").strip()
-                p = text_frame.add_paragraph()
-                p.text = f"  • {clean_dp}"  # Indented sub-bullet
-                p.font.name = "Calibri"
-                p.font.size = Pt(16)
-                p.font.color.rgb = colors["text_color"]  # Same color for consistency
-                p.font.bold = True
-                p.alignment = PP_ALIGN.LEFT
-                p.level = 0
+        # Add bullet points - strip existing bullets and add a single one manually
+        bullets = [f"• {_BULLET_RE.sub('', item).rstrip()}" for item in slide_data.get("content", [])]
+        
+        # Add data points if available - as bold, indented sub-items without double bullets
+        data_points = [f"  • {_BULLET_RE.sub('', dp).rstrip()}" for dp in slide_data.get("data_points", [])]
+        
+        # Build all paragraphs as one fragment and insert it in a single pass
+        hex_colors = colors["_hex"]
+        _extend_text_frame(text_frame, (
+            _paragraphs_xml(bullets, "Calibri", _PT_SIZES[18], hex_colors["text"], align=PP_ALIGN.LEFT)
+            + _paragraphs_xml(data_points, "Calibri", _PT_SIZES[16], hex_colors["text"], align=PP_ALIGN.LEFT, bold=True)
+        ))
         
         # Add image if available - smaller, right side, lower position
         visual_suggestion = slide_data.get("visual_suggestion", {})
         if visual_suggestion and visual_suggestion.get("image_url"):
-            self._add_image_to_slide(slide, visual_suggestion, colors)
+            self._add_image_to_slide(slide, visual_suggestion, colors, images)
         
         # No key insight box for clean slides
     
-    def _add_image_to_slide(self, slide, visual_suggestion: Dict, colors: Dict):
+    def _add_image_to_slide(self, slide, visual_suggestion: Dict, colors: Dict,
+                            images: Optional[Dict[str, Optional[bytes]]] = None):
         """Add image to slide - smaller, right side, no overlap with text"""
         image_url = visual_suggestion.get("image_url")
         if not image_url:
             return
         
         try:
-            # Download image
-            import requests
-            response = requests.get(image_url, timeout=10)
-            response.raise_for_status()
+            # Use the prefetched download if there is one (memoized per URL otherwise)
+            if images is not None and image_url in images:
+                image_bytes = images[image_url]
+            else:
+                image_bytes = self._fetch_image_bytes(image_url)
+            if image_bytes is None:
+                return
             
             # Position image in bottom-right corner, slightly bigger size
-            image_left = Inches(9.0)  # Adjusted left for bigger image
-            image_top = Inches(4.2)  # Adjusted top
-            image_width = Inches(3.0)  # Slightly bigger width
-            image_height = Inches(2.5)  # Proportional height
+            image_left = _INCHES[9.0]  # Adjusted left for bigger image
+            image_top = _INCHES[4.2]  # Adjusted top
+            image_width = _INCHES[3.0]  # Slightly bigger width
+            image_height = _INCHES[2.5]  # Proportional height
             
-            # Add image
+            # Add image - python-pptx stores identical image bytes as a single
+            # media part, so repeated images are not duplicated in the package
             img_placeholder = slide.shapes.add_picture(
-                io.BytesIO(response.content),
+                io.BytesIO(image_bytes),
                 image_left, image_top, 
                 width=image_width, height=image_height
             )
             
             # Add subtle image caption below - smaller, no bold, gray color
-            caption_top = image_top + image_height + Inches(0.05)
-            caption_shape = slide.shapes.add_textbox(image_left, caption_top, image_width, Inches(0.3))
+            caption_top = image_top + image_height + _INCHES[0.05]
+            caption_shape = slide.shapes.add_textbox(image_left, caption_top, image_width, _INCHES[0.3])
             caption_frame = caption_shape.text_frame
             caption_para = caption_frame.add_paragraph()
             caption_para.text = visual_suggestion.get("image_description", "Visual Representation")
-            caption_para.font.name = "Calibri"
-            caption_para.font.size = Pt(10)
-            caption_para.font.color.rgb = RGBColor(128, 128, 128)  # Gray for subtlety
-            caption_para.font.bold = False
-            caption_para.alignment = PP_ALIGN.CENTER
+            _apply_para_style(caption_para, "Calibri", _PT_SIZES[10], _CAPTION_GRAY_HEX, align=PP_ALIGN.CENTER, bold=False)
                 
         except Exception as e:
             # Skip image if download fails - no placeholder
             pass
     
+    def _prefetch_images(self, slides: List[Dict]) -> Dict[str, Optional[bytes]]:
+        """Download all distinct slide image URLs in parallel (None for failures)"""
+        image_urls = []
+        for slide_data in slides:
+            image_url = (slide_data.get("visual_suggestion") or {}).get("image_url")
+            if image_url and image_url not in image_urls:
+                image_urls.append(image_url)
+        if not image_urls:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(_IMAGE_FETCH_WORKERS, len(image_urls))) as executor:
+            return dict(zip(image_urls, executor.map(self._try_fetch_image, image_urls)))
+    
+    def _try_fetch_image(self, image_url: str) -> Optional[bytes]:
+        """Fetch image bytes, returning None instead of raising so one bad URL doesn't stop the rest"""
+        try:
+            return self._fetch_image_bytes(image_url)
+        except Exception:
+            return None
+    
+    def _download_image(self, image_url: str) -> bytes:
+        """Download raw image bytes over the shared HTTP session"""
+        response = self._session.get(image_url, timeout=10)
+        response.raise_for_status()
+        return response.content
+    
     def _create_summary_slide(self, prs, content: Dict, colors: Dict):
         """Create summary/recommendations slide"""
         slide_layout = prs.slide_layouts[1]
         slide = prs.slides.add_slide(slide_layout)
         
-        # Set background
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = colors["background_color"]
-        
         # Title
         title = slide.shapes.title
         title.text = "Key Recommendations"
@@ -391,58 +571,31 @@ class ProfessionalPPTGenerator:
         text_frame = content_placeholder.text_frame
         text_frame.clear()
         
-        recommendations = content.get("key_recommendations", [
-            "Strategic recommendation based on analysis",
-            "Operational improvement opportunity", 
-            "Risk mitigation strategy"
-        ])
-        
-        for i, rec in enumerate(recommendations):
-            p = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
-            p.text = f"{i+1}. {rec}"
-            p.font.name = "Calibri"
-            p.font.size = Pt(20)
-            p.font.color.rgb = colors["text_color"]
-            p.font.bold = True
-            p.level = 0
+        recommendations = content.get("key_recommendations") or _DEFAULT_RECOMMENDATIONS
+        
+        _extend_text_frame(text_frame, _paragraphs_xml(
+            [f"{i+1}. {rec}" for i, rec in enumerate(recommendations)],
+            "Calibri", _PT_SIZES[20], colors["_hex"]["text"], bold=True
+        ))
         
         # Add next steps box
         next_steps_box = slide.shapes.add_textbox(
-            Inches(8), Inches(2), Inches(4.5), Inches(4)
+            _INCHES[8], _INCHES[2], _INCHES[4.5], _INCHES[4]
         )
         next_steps_frame = next_steps_box.text_frame
         next_steps_para = next_steps_frame.paragraphs[0]
         next_steps_para.text = "Next Steps"
-        next_steps_para.font.name = "Calibri"
-        next_steps_para.font.size = Pt(18)
-        next_steps_para.font.color.rgb = colors["primary_color"]
-        next_steps_para.font.bold = True
-        
-        steps = [
-            "Review and validate findings",
-            "Implement priority recommendations",
-            "Monitor key performance indicators",
-            "Schedule follow-up analysis"
-        ]
+        _apply_para_style(next_steps_para, "Calibri", _PT_SIZES[18], colors["_hex"]["primary"], bold=True)
         
-        for step in steps:
-            step_para = next_steps_frame.add_paragraph()
-            step_para.text = f"• {step}"
-            step_para.font.name = "Calibri"
-            step_para.font.size = Pt(14)
-            step_para.font.color.rgb = colors["text_color"]
+        _extend_text_frame(next_steps_frame, _paragraphs_xml(
+            [f"• {step}" for step in _DEFAULT_STEPS], "Calibri", _PT_SIZES[14], colors["_hex"]["text"]
+        ))
     
     def _create_appendix_slide(self, prs, content: Dict, colors: Dict):
         """Create appendix slide"""
         slide_layout = prs.slide_layouts[1]
         slide = prs.slides.add_slide(slide_layout)
         
-        # Set background
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = colors["background_color"]
-        
         # Title
         title = slide.shapes.title
         title.text = "Appendix & Supporting Materials"
@@ -453,57 +606,48 @@ class ProfessionalPPTGenerator:
         text_frame = content_placeholder.text_frame
         text_frame.clear()
         
-        appendix_items = content.get("appendix_suggestions", [
-            "Detailed financial models and assumptions",
-            "Supporting market research and analysis",
-            "Risk assessment matrices and scenarios",
-            "Additional data sources and methodology"
-        ])
-        
-        for i, item in enumerate(appendix_items):
-            p = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
-            p.text = f"• {item}"
-            p.font.name = "Calibri"
-            p.font.size = Pt(18)
-            p.font.color.rgb = colors["text_color"]
-            p.level = 0
+        appendix_items = content.get("appendix_suggestions") or _DEFAULT_APPENDIX
+        
+        _extend_text_frame(text_frame, _paragraphs_xml(
+            [f"• {item}" for item in appendix_items], "Calibri", _PT_SIZES[18], colors["_hex"]["text"]
+        ))
         
         # Add contact information
         contact_box = slide.shapes.add_textbox(
-            Inches(8), Inches(4), Inches(4.5), Inches(2)
+            _INCHES[8], _INCHES[4], _INCHES[4.5], _INCHES[2]
         )
         contact_frame = contact_box.text_frame
         contact_para = contact_frame.paragraphs[0]
         contact_para.text = "Questions & Discussion"
-        contact_para.font.name = "Calibri"
-        contact_para.font.size = Pt(18)
-        contact_para.font.color.rgb = colors["primary_color"]
-        contact_para.font.bold = True
+        _apply_para_style(contact_para, "Calibri", _PT_SIZES[18], colors["_hex"]["primary"], bold=True)
         
         contact_content = contact_frame.add_paragraph()
         contact_content.text = "Generated by FinancePPT AI\nProfessional Financial Analysis Platform"
-        contact_content.font.name = "Calibri"
-        contact_content.font.size = Pt(14)
-        contact_content.font.color.rgb = colors["text_color"]
+        _apply_para_style(contact_content, "Calibri", _PT_SIZES[14], colors["_hex"]["text"])
     
     def _format_slide_title(self, title_shape, colors: Dict):
         """Apply consistent title formatting"""
         title_frame = title_shape.text_frame
         title_para = title_frame.paragraphs[0]
-        title_para.font.name = "Calibri"
-        title_para.font.size = Pt(32)
-        title_para.font.color.rgb = colors["primary_color"]
-        title_para.font.bold = True
+        _apply_para_style(title_para, "Calibri", _PT_SIZES[32], colors["_hex"]["primary"], bold=True)
     
-    def save_presentation(self, ppt_bytes: bytes, filename: str) -> str:
-        """Save presentation to output directory"""
-        output_path = os.path.join("output", filename)
+    def get_output_path(self, filename: str) -> str:
+        """Resolve a filename inside the output directory, creating it if needed"""
         os.makedirs("output", exist_ok=True)
+        return os.path.join("output", filename)
+    
+    def save_presentation(self, ppt_bytes: Union[bytes, memoryview], filename: str) -> str:
+        """Save presentation to output directory"""
+        output_path = self.get_output_path(filename)
         
-        with open(output_path, "wb") as f:
+        with open(output_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
             f.write(ppt_bytes)
         
         return output_path
+    
+    def save_presentation_to_path(self, content: Dict[str, Any], template: str, filename: str) -> str:
+        """Build a presentation and stream it straight into the output directory"""
+        return self.create_presentation(content, template, output=self.get_output_path(filename))
 
 # Global PPT generator instance
 ppt_generator = ProfessionalPPTGenerator()
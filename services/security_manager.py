@@ -1,19 +1,43 @@
-import os
-import hashlib
 import secrets
 from typing import Dict, Optional
 import streamlit as st
 from pathlib import Path
 from typing import Any, Dict
 from typing import List, Dict
+from config.settings import config
+from functools import lru_cache
 
 
+@lru_cache(maxsize=16)
+def _mask_api_key(api_key: Optional[str]) -> str:
+    """Mask an API key for display (memoized: the same few keys are re-rendered on every rerun)"""
+    if not api_key:
+        return "Not configured"
+    
+    if len(api_key) < 8:
+        return "Invalid key"
+    
+    return f"{api_key[:4]}...{api_key[-4:]}"
+
 
 class SecurityManager:
     """Manage secure operations and API key validation"""
     
     def __init__(self):
         self.session_token = self._generate_session_token()
+        self.refresh()
+    
+    def refresh(self):
+        """Rescan the project files and API keys the security checks depend on"""
+        # Streamlit re-runs the checks on every interaction, so stat once here
+        self._env_exists = Path(".env").exists()
+        self._gitignore_exists = Path(".gitignore").exists()
+        # Check if at least one API key is configured
+        self._api_keys_present = any((
+            config.openai_api_key,
+            config.gemini_api_key,
+            config.anthropic_api_key
+        ))
     
     def _generate_session_token(self) -> str:
         """Generate a secure session token"""
@@ -22,27 +46,18 @@ class SecurityManager:
     def validate_environment(self) -> Dict[str, bool]:
         """Validate that environment is properly configured"""
         validation_results = {
-            "env_file_exists": Path(".env").exists(),
-            "api_keys_configured": False,
+            "env_file_exists": self._env_exists,
+            "api_keys_configured": self._api_keys_present,
             "secure_setup": True
         }
         
-        # Check if at least one API key is configured
-        api_keys = [
-            os.getenv("OPENAI_API_KEY"),
-            os.getenv("GEMINI_API_KEY"),
-            os.getenv("ANTHROPIC_API_KEY")
-        ]
-        
-        validation_results["api_keys_configured"] = any(key for key in api_keys)
-        
         return validation_results
     
     def check_api_key_security(self) -> Dict[str, str]:
         """Check API key security status"""
         status = {
-            "storage": "secure" if Path(".env").exists() else "missing",
-            "git_protection": "protected" if Path(".gitignore").exists() else "vulnerable",
+            "storage": "secure" if self._env_exists else "missing",
+            "git_protection": "protected" if self._gitignore_exists else "vulnerable",
             "environment_isolation": "isolated"
         }
         
@@ -50,13 +65,7 @@ class SecurityManager:
     
     def mask_api_key(self, api_key: Optional[str]) -> str:
         """Safely mask API key for display purposes"""
-        if not api_key:
-            return "Not configured"
-        
-        if len(api_key) < 8:
-            return "Invalid key"
-        
-        return f"{api_key[:4]}...{api_key[-4:]}"
+        return _mask_api_key(api_key)
     
     def validate_session(self) -> bool:
         """Validate current session security"""
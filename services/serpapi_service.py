@@ -1,96 +1,175 @@
+import asyncio
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
 import streamlit as st
 from config.settings import config
 
+try:
+    import orjson
+except ImportError:  # optional speedup; requests' stdlib decoding is used instead
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; topic responses are then parsed in one go
+    ijson = None
+
+try:
+    import requests_cache
+except ImportError:  # optional on-disk cache; searches then hit the network every run
+    requests_cache = None
+
+# Transient SerpAPI failures (rate limiting, gateway hiccups) worth retrying
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Words that mark a search result as finance-related
+FINANCIAL_KEYWORDS = frozenset(('financial', 'analysis', 'performance', 'market', 'stock', 'nifty', 'report'))
+_SPLIT_RE = re.compile(r"\W+")
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+# Bullets taken from search snippets per slide
+MAX_BULLETS = 4
+# Filler bullets by slide kind when search yields fewer than three
+_FALLBACK_TMPL = {
+    "analysis": "• Comprehensive {} based on current market data",
+    "performance": "• Key performance indicators for {}",
+    "overview": "• Strategic overview of {}",
+    "generic": "• Industry insights for {}"
+}
+
+
+@lru_cache(maxsize=1024)
+def _tokenize(text: str) -> frozenset:
+    """Lowercased word set of text, memoized as the same results get scored for every slide"""
+    return frozenset(_SPLIT_RE.split(text.lower()))
+
+# Search results are reused across slides and reruns for up to an hour
+_SEARCH_CACHE_SIZE = 256
+_SEARCH_CACHE_TTL = 3600
+# On-disk response cache (used when requests-cache is installed), kept inside the project
+_DISK_CACHE_PATH = config.base_dir / "cache" / "serpapi_cache.sqlite"
+
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire after ``ttl`` seconds"""
+
+    __slots__ = ("maxsize", "ttl", "_data", "_lock")
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
 class SerpAPIService:
     """Service for fetching real financial data from Google search results via SerpAPI"""
 
+    __slots__ = ("api_key", "base_url", "session", "_topic_cache", "_image_cache")
+
     def __init__(self):
         self.api_key = config.serpapi_api_key
         self.base_url = "https://serpapi.com/search.json"
+        # One keep-alive pool for every search so concurrent slide queries reuse
+        # TLS connections to serpapi.com instead of handshaking per call
+        if requests_cache is not None:
+            # SQLite-backed so repeat topics survive app restarts
+            _DISK_CACHE_PATH.parent.mkdir(exist_ok=True)
+            self.session = requests_cache.CachedSession(
+                str(_DISK_CACHE_PATH), backend="sqlite", expire_after=_SEARCH_CACHE_TTL, allowable_methods=("GET",)
+            )
+        else:
+            self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=_RETRY_STATUSES)
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries))
+        # Successful responses only; failures are retried on the next call
+        self._topic_cache = _TTLCache(_SEARCH_CACHE_SIZE, _SEARCH_CACHE_TTL)
+        self._image_cache = _TTLCache(_SEARCH_CACHE_SIZE, _SEARCH_CACHE_TTL)
         if not self.api_key:
             st.warning("SERPAPI_API_KEY not found. Search-based content generation will not work.")
 
 
+    def warmup(self) -> None:
+        """Open a pooled connection to SerpAPI ahead of the first search
+
+        Pays the DNS lookup and TLS handshake up front; failures are ignored
+        since the real searches report their own errors.
+        """
+        try:
+            self.session.head(self.base_url, timeout=10)
+        except requests.RequestException:
+            pass
+
     def extract_bullet_points(self, search_results: Dict[str, Any], slide_title: str) -> List[str]:
         """Extract relevant bullet points from search results for a specific slide"""
-        bullets = []
         results = search_results.get('results', [])
 
         # Keywords to match slide title
-        slide_keywords = slide_title.lower().split()
+        title_lower = slide_title.lower()
+        slide_keywords = _tokenize(title_lower) - {''}
+
+        # Results past the one that fills the quota are never scored or split
+        bullets = list(islice(self._iter_bullets(results, slide_keywords), MAX_BULLETS))
 
+        # If not enough bullets, add generic ones based on slide title
+        if len(bullets) < 3:
+            kind = next((k for k in ("analysis", "performance", "overview") if k in title_lower), "generic")
+            bullet = _FALLBACK_TMPL[kind].format(title_lower)
+            # Generic titles get a single filler bullet; the others top up to three
+            bullets.extend([bullet] * (1 if kind == "generic" else 3 - len(bullets)))
+
+        return bullets[:6]  # Max 6 bullets for more content
+
+    @staticmethod
+    def _iter_bullets(results: List[Dict[str, Any]], slide_keywords: frozenset) -> Iterator[str]:
+        """Lazily yield bullets from the relevant results among the top 5"""
         for result in results[:5]:  # Use top 5 results
             snippet = result.get('snippet', '')
             title = result.get('title', '')
 
             # Check relevance - be more lenient
-            combined_text = (snippet + title).lower()
-            relevance_score = sum(1 for keyword in slide_keywords if keyword in combined_text)
+            tokens = _tokenize(f"{snippet} {title}")
+            relevance_score = len(slide_keywords & tokens)
 
             # Also check for financial keywords
-            financial_keywords = ['financial', 'analysis', 'performance', 'market', 'stock', 'nifty', 'report']
-            financial_score = sum(1 for keyword in financial_keywords if keyword in combined_text)
+            financial_score = len(FINANCIAL_KEYWORDS & tokens)
 
             if relevance_score > 0 or financial_score > 1:
-                # Extract key sentences or phrases
-                sentences = snippet.split('. ')
-                for sentence in sentences[:2]:  # Take first 2 sentences
-                    if len(sentence.strip()) > 20:  # Meaningful length
-                        # Clean and format as bullet
-                        bullet = sentence.strip()
-                        if not bullet.startswith('•'):
-                            bullet = f"• {bullet}"
-                        bullets.append(bullet)
-
-                        if len(bullets) >= 4:  # Limit to 4 bullets per slide
-                            break
-
-            if len(bullets) >= 4:
-                break
-
-        # If not enough bullets, add generic ones based on slide title
-        while len(bullets) < 3:
-            if 'analysis' in slide_title.lower():
-                bullets.append(f"• Comprehensive {slide_title.lower()} based on current market data")
-            elif 'performance' in slide_title.lower():
-                bullets.append(f"• Key performance indicators for {slide_title.lower()}")
-            elif 'overview' in slide_title.lower():
-                bullets.append(f"• Strategic overview of {slide_title.lower()}")
-            else:
-                bullets.append(f"• Industry insights for {slide_title.lower()}")
-                break
-
-        return bullets[:6]  # Max 6 bullets for more content
+                # First 2 sentences of meaningful length, formatted as bullets
+                for sentence in map(str.strip, _SENT_RE.split(snippet, maxsplit=2)[:2]):
+                    if len(sentence) > 20:
+                        yield sentence if sentence.startswith('•') else f"• {sentence}"
 
     def search_financial_topic(self, topic: str, num_results: int = 10) -> Dict[str, Any]:
         """Search for financial topic using SerpAPI"""
         try:
-            params = {
-                'engine': 'google',
-                'q': f"{topic} financial analysis",
-                'api_key': self.api_key,
-                'num': num_results
-            }
-
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
-            results = []
-
-            if 'organic_results' in data:
-                for result in data['organic_results'][:num_results]:
-                    results.append({
-                        'title': result.get('title', ''),
-                        'snippet': result.get('snippet', ''),
-                        'link': result.get('link', '')
-                    })
-
-            return {'results': results}
-
+            return self._fetch_topic_results(topic, num_results)
         except Exception as e:
             st.error(f"Error fetching search results: {str(e)}")
             return {'results': []}
@@ -98,28 +177,141 @@ class SerpAPIService:
     def search_images(self, query: str, num_results: int = 5) -> List[str]:
         """Search for images using SerpAPI"""
         try:
-            params = {
-                'engine': 'google_images',
-                'q': query,
-                'api_key': self.api_key,
-                'num': num_results
-            }
+            return self._fetch_image_urls(query, num_results)
+        except Exception as e:
+            st.error(f"Error fetching images: {str(e)}")
+            return []
+
+    async def search_financial_topic_async(self, topic: str, num_results: int = 10) -> Dict[str, Any]:
+        """Async variant of search_financial_topic; the HTTP call runs in a worker thread"""
+        try:
+            return await asyncio.to_thread(self._fetch_topic_results, topic, num_results)
+        except Exception as e:
+            # Reported from the event loop (caller's) thread so Streamlit can show it
+            st.error(f"Error fetching search results: {str(e)}")
+            return {'results': []}
+
+    async def search_images_async(self, query: str, num_results: int = 5) -> List[str]:
+        """Async variant of search_images; the HTTP call runs in a worker thread"""
+        try:
+            return await asyncio.to_thread(self._fetch_image_urls, query, num_results)
+        except Exception as e:
+            st.error(f"Error fetching images: {str(e)}")
+            return []
+
+    async def search_many_async(self, topics: Iterable[str], num_results: int = 10,
+                                image_queries: Iterable[str] = (), num_images: int = 5
+                                ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[str]]]:
+        """Run every distinct topic and image search concurrently, keyed by query"""
+        topics = list(dict.fromkeys(topics))
+        image_queries = list(dict.fromkeys(image_queries))
+
+        responses = await asyncio.gather(
+            *(self.search_financial_topic_async(topic, num_results) for topic in topics),
+            *(self.search_images_async(query, num_images) for query in image_queries)
+        )
+
+        return (
+            dict(zip(topics, responses[:len(topics)])),
+            dict(zip(image_queries, responses[len(topics):]))
+        )
 
-            response = requests.get(self.base_url, params=params, timeout=30)
+    def search_many(self, topics: Iterable[str], num_results: int = 10,
+                    image_queries: Iterable[str] = (), num_images: int = 5
+                    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[str]]]:
+        """Blocking wrapper around search_many_async: N searches cost ~1 round trip instead of N"""
+        return asyncio.run(self.search_many_async(topics, num_results, image_queries, num_images))
+
+    def search_financial_topics_batch(self, topics: Iterable[str], num_results: int = 10) -> Dict[str, Dict[str, Any]]:
+        """Search several topics at once, returning results keyed by topic
+
+        SerpAPI has no multi-query endpoint, and OR-ing queries together makes
+        results impossible to attribute, so the topics are fanned out concurrently
+        over the pooled session; cached topics cost nothing.
+        """
+        topic_results, _ = self.search_many(topics, num_results)
+        return topic_results
+
+    def _fetch_topic_results(self, topic: str, num_results: int) -> Dict[str, Any]:
+        """Query SerpAPI's Google engine and keep the organic results (raises on HTTP errors)"""
+        key = (topic, num_results)
+        cached = self._topic_cache.get(key)
+        if cached is not None:
+            return cached
+
+        params = {
+            'engine': 'google',
+            'q': f"{topic} financial analysis",
+            'api_key': self.api_key,
+            'num': num_results
+        }
+
+        # requests-cache would store a response ijson only partly read, truncated,
+        # so the disk-cached session always downloads and parses the whole body
+        disk_cached = requests_cache is not None and isinstance(self.session, requests_cache.CachedSession)
+        if ijson is not None and not disk_cached:
+            # Parse incrementally and stop after num_results organic entries, so the
+            # sections that follow (related searches, knowledge graph...) are never
+            # built into Python objects
+            with self.session.get(self.base_url, params=params, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                organic = list(islice(ijson.items(response.raw, 'organic_results.item'), num_results))
+                # Discard the unread tail so the connection goes back to the pool
+                drain = getattr(response.raw, 'drain_conn', None)
+                if drain is not None:
+                    drain()
+        else:
+            response = self.session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
+            organic = self._parse_json(response).get('organic_results', [])[:num_results]
 
-            data = response.json()
-            image_urls = []
+        results = [
+            {
+                'title': result.get('title', ''),
+                'snippet': result.get('snippet', ''),
+                'link': result.get('link', '')
+            }
+            for result in organic
+        ]
 
-            if 'images_results' in data:
-                for image in data['images_results'][:num_results]:
-                    image_urls.append(image.get('original', ''))
+        search_results = {'results': results}
+        self._topic_cache[key] = search_results
+        return search_results
 
-            return image_urls
+    def _fetch_image_urls(self, query: str, num_results: int) -> List[str]:
+        """Query SerpAPI's Google Images engine for original image URLs (raises on HTTP errors)"""
+        key = (query, num_results)
+        cached = self._image_cache.get(key)
+        if cached is not None:
+            return cached
 
-        except Exception as e:
-            st.error(f"Error fetching images: {str(e)}")
-            return []
+        params = {
+            'engine': 'google_images',
+            'q': query,
+            'api_key': self.api_key,
+            'num': num_results
+        }
+
+        response = self.session.get(self.base_url, params=params, timeout=30)
+        response.raise_for_status()
+
+        data = self._parse_json(response)
+        image_urls = []
+
+        if 'images_results' in data:
+            for image in data['images_results'][:num_results]:
+                image_urls.append(image.get('original', ''))
+
+        self._image_cache[key] = image_urls
+        return image_urls
+
+    @staticmethod
+    def _parse_json(response: requests.Response) -> Dict[str, Any]:
+        """Decode a SerpAPI response body, using orjson when it is installed"""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
 
     def generate_slide_content(self, topic: str, slide_titles: List[str]) -> Dict[str, Any]:
         """Generate complete slide content from search results"""
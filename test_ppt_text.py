@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Regression test: slide text with control characters must not break deck generation
+"""
+
+import io
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pptx import Presentation
+from services.ppt_generator import ppt_generator
+
+# Form feed, escape, backspace and carriage return: python-pptx writes these as _xHHHH_
+CONTROL_TEXT = "x\x0cy \x1b\x08 z\r<&>"
+EXPECTED_ESCAPES = ("_x000C_", "_x001B_", "_x0008_", "_x000D_")
+
+def test_control_characters():
+    """Bullets, data points and agenda items containing control characters"""
+    print("Testing slide text with control characters...")
+
+    content = {
+        "presentation_title": "Control Character Check",
+        "slides": [
+            {
+                "title": f"Agenda {CONTROL_TEXT}",
+                "content": [f"Bullet {CONTROL_TEXT}", "Line one\vline two"],
+                "data_points": [f"Data {CONTROL_TEXT}"]
+            }
+        ]
+    }
+
+    for template in ppt_generator.templates:
+        try:
+            ppt_bytes = ppt_generator.create_presentation(content, template=template)
+        except Exception as e:
+            print(f"❌ FAIL: {template}: {e}")
+            return False
+
+        prs = Presentation(io.BytesIO(ppt_bytes))
+        texts = [
+            run.text
+            for slide in prs.slides
+            for shape in slide.shapes if shape.has_text_frame
+            for paragraph in shape.text_frame.paragraphs
+            for run in paragraph.runs
+        ]
+        for label in ("Agenda", "Bullet", "Data"):
+            if not any(label in text and all(e in text for e in EXPECTED_ESCAPES) for text in texts):
+                print(f"❌ FAIL: {template}: {label} text not escaped like python-pptx")
+                return False
+        print(f"✅ PASS: {template}")
+
+    print("🎉 Control characters are escaped in every template.")
+    return True
+
+if __name__ == "__main__":
+    success = test_control_characters()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for SerpAPI response caching: a disk-cache miss followed by a hit
+"""
+
+import sys
+import os
+import json
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import services.serpapi_service as serpapi_module
+from services.serpapi_service import SerpAPIService
+
+# Canned SerpAPI payload: more organic results than requested plus trailing sections
+_PAYLOAD = json.dumps({
+    "search_metadata": {"status": "Success"},
+    "organic_results": [
+        {"title": f"Result {i}", "snippet": f"Snippet {i}. More text.", "link": f"https://example.com/{i}"}
+        for i in range(10)
+    ],
+    "related_searches": [{"query": f"related {i}"} for i in range(200)]
+}).encode("utf-8")
+
+class _SerpHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = 0
+
+    def do_GET(self):
+        _SerpHandler.hits += 1
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(_PAYLOAD)
+
+    def log_message(self, *args):
+        pass
+
+def test_disk_cache_miss_then_hit():
+    """A response cached on disk must still yield every result on the next run"""
+    print("Testing SerpAPI disk cache miss then hit...")
+
+    if serpapi_module.requests_cache is None:
+        print("ℹ️  SKIP: requests-cache is not installed")
+        return True
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SerpHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/search.json"
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        serpapi_module._DISK_CACHE_PATH = Path(cache_dir) / "serpapi_cache.sqlite"
+        try:
+            # Fresh instances each time so the in-memory TTL cache can't answer,
+            # as after an app restart
+            outcomes = []
+            for label in ("miss", "hit"):
+                service = SerpAPIService()
+                service.base_url = base_url
+                results = service.search_financial_topic("AAPL", num_results=5)["results"]
+                outcomes.append((label, len(results), _SerpHandler.hits))
+        finally:
+            server.shutdown()
+
+    passed = True
+    for label, count, hits in outcomes:
+        if count == 5:
+            print(f"✅ PASS: {label} returned {count} results (server hits: {hits})")
+        else:
+            print(f"❌ FAIL: {label} returned {count} results, expected 5")
+            passed = False
+
+    if _SerpHandler.hits != 1:
+        print(f"❌ FAIL: expected the hit to be served from disk, server saw {_SerpHandler.hits} requests")
+        passed = False
+
+    return passed
+
+if __name__ == "__main__":
+    success = test_disk_cache_miss_then_hit()
+    sys.exit(0 if success else 1)
@@ -1,8 +1,211 @@
+import io
+import itertools
 import os
+import queue
+import re
+import sys
+import threading
+import time
+from collections import Counter
 from services.content_generator import content_generator
 from services.ppt_generator import ppt_generator
 from datetime import datetime
 
+# Per-focus content requirement: (visual_summary key that must be truthy, failure status)
+_PRECONDITIONS = {
+    "balance": ("balance_sheet_slide", "FAILED - no balance slide"),
+    "images": ("slides_with_image_urls", "FAILED - no image slides")
+}
+
+# Seconds a case may run before it is reported as failed; cases start together
+CASE_TIMEOUT = 120
+
+# Set VERBOSE=1 to list every image placeholder in the summary
+VERBOSE = bool(os.environ.get("VERBOSE"))
+
+# Title keywords that mark a slide as covering each topic
+RISK_KEYS = ("risk", "volatility", "assessment")
+COMP_KEYS = ("competitive", "market position", "position")
+REV_KEYS = ("revenue", "profitability")
+# Every title keyword in one alternation, so each title is scanned once
+_TITLE_RE = re.compile("|".join(map(re.escape, ("balance", "performance") + RISK_KEYS + COMP_KEYS + REV_KEYS)))
+
+def _evaluate_case(case, file_suffix, buf):
+    """Generate content and a deck for one test case and summarise its visuals
+
+    Progress lines go to ``buf``; ``file_suffix`` makes the deck's filename
+    unique within the run.
+    """
+    print(f"\n=== Testing {case['name']} ===", file=buf)
+    start_time = time.perf_counter()
+    
+    # Generate content
+    content = content_generator.generate_presentation_content(
+        topic=case["topic"],
+        presentation_type=case["presentation_type"],
+        target_audience=case["target_audience"],
+        slide_count=case["slide_count"],
+        include_real_data=case["include_real_data"],
+        content_provider="SerpAPI"
+    )
+    
+    generation_time = time.perf_counter() - start_time
+    print(f"Content generation time: {generation_time:.2f}s", file=buf)
+    
+    if not content:
+        return {
+            "case": case["name"],
+            "status": "FAILED - No content generated",
+            "visual_summary": None,
+            "times": {"content": generation_time, "ppt": 0, "total": generation_time}
+        }
+    
+    # Analyze content visuals with enhanced checks
+    visual_summary = {
+        "total_slides": len(content.get("slides", [])),
+        "slides_with_charts": 0,
+        "slides_with_tables": 0,
+        "slides_with_images": 0,
+        "slides_with_image_urls": 0,
+        "pie_charts": 0,
+        "bar_charts": 0,
+        "line_charts": 0,
+        "balance_pie": False,
+        "risk_pie": False,
+        "competitive_pie": False,
+        "revenue_table": False,
+        "performance_table": False,
+        "balance_table": False,
+        "image_placeholders": [],
+        "balance_sheet_slide": None
+    }
+    
+    chart_counts = Counter()
+    for slide in content["slides"]:
+        title_lower = slide["title"].lower()
+        hits = set(_TITLE_RE.findall(title_lower))
+        vs = slide.get("visual_suggestion") or {}
+        table_data = slide.get("table_data")
+        image_suggestion = slide.get("image_suggestion")
+        if vs:
+            visual_summary["slides_with_charts"] += 1
+            chart_type = vs.get("chart_type", "")
+            chart_counts[chart_type] += 1
+            if chart_type == "pie":
+                if "balance" in hits:
+                    visual_summary["balance_pie"] = True
+                if not hits.isdisjoint(RISK_KEYS):
+                    visual_summary["risk_pie"] = True
+                if not hits.isdisjoint(COMP_KEYS):
+                    visual_summary["competitive_pie"] = True
+    
+        if table_data:
+            visual_summary["slides_with_tables"] += 1
+            if not hits.isdisjoint(REV_KEYS):
+                visual_summary["revenue_table"] = True
+            if "performance" in hits:
+                visual_summary["performance_table"] = True
+            if "balance" in hits:
+                visual_summary["balance_table"] = True
+    
+        # Images the deck will actually insert come from the visual suggestion
+        if vs.get("image_url"):
+            visual_summary["slides_with_image_urls"] += 1
+        
+        if image_suggestion:
+            visual_summary["slides_with_images"] += 1
+            img_desc = image_suggestion.get("description", "")
+            visual_summary["image_placeholders"].append((slide["title"], img_desc))
+    
+        # Specific balance sheet check ("balance sheet" titles included)
+        if "balance" in hits:
+            visual_summary["balance_sheet_slide"] = {
+                "title": slide["title"],
+                "has_chart": bool(vs),
+                "chart_type": vs.get("chart_type") if vs else None,
+                "has_table": bool(table_data),
+                "has_image": bool(image_suggestion)
+            }
+    
+    visual_summary["pie_charts"] = chart_counts["pie"]
+    visual_summary["bar_charts"] = chart_counts["bar"]
+    visual_summary["line_charts"] = chart_counts["line"]
+    
+    # Content that already lacks what the case exercises fails without building a deck
+    precondition = _PRECONDITIONS.get(case["focus"])
+    if precondition and not visual_summary[precondition[0]]:
+        status = precondition[1]
+        print(status, file=buf)
+        visual_summary["ppt_generated"] = False
+        return {
+            "case": case["name"],
+            "status": status,
+            "visual_summary": visual_summary,
+            "times": {"content": generation_time, "ppt": 0, "total": time.perf_counter() - start_time}
+        }
+    
+    # Generate PPT with timing
+    ppt_start = time.perf_counter()
+    try:
+        sanitized_topic = case["topic"][:20].replace(" ", "_")
+        filename = f"test_{sanitized_topic}_{case['presentation_type']}_{file_suffix}.pptx"
+        ppt_file = ppt_generator.save_presentation_to_path(content, case["template"], filename)
+        ppt_time = time.perf_counter() - ppt_start
+        print(f"PPT generation time: {ppt_time:.2f}s", file=buf)
+    
+        if ppt_file:
+            visual_summary["ppt_generated"] = True
+            visual_summary["ppt_file"] = ppt_file
+            print(f"PPT generated successfully: {ppt_file}", file=buf)
+        else:
+            visual_summary["ppt_generated"] = False
+            print("PPT generation failed", file=buf)
+    except Exception as e:
+        visual_summary["ppt_generated"] = False
+        visual_summary["error"] = str(e)
+        print(f"PPT generation error: {e}", file=buf)
+        ppt_time = 0
+    
+    total_time = time.perf_counter() - start_time
+    return {
+        "case": case["name"],
+        "status": "PASSED" if visual_summary.get("ppt_generated", False) else "FAILED",
+        "visual_summary": visual_summary,
+        "times": {"content": generation_time, "ppt": ppt_time, "total": total_time}
+    }
+
+def _format_case_report(result):
+    """Render one case's summary block for the test report"""
+    lines = [f"\n{result['case']}: {result['status']}"]
+    summary = result["visual_summary"]
+    if summary:
+        lines.append(f"  Charts: {summary['slides_with_charts']}/{summary['total_slides']}")
+        lines.append(f"  Tables: {summary['slides_with_tables']}")
+        lines.append(f"  Images: {summary['slides_with_images']} (Image URLs: {summary['slides_with_image_urls']})")
+        lines.append(f"  Pie Charts: {summary['pie_charts']} (Balance: {summary['balance_pie']}, Risk: {summary['risk_pie']}, Competitive: {summary['competitive_pie']})")
+        lines.append(f"  Revenue Table: {summary['revenue_table']}, Performance: {summary['performance_table']}, Balance: {summary['balance_table']}")
+        if summary.get("image_placeholders"):
+            lines.append(f"  Image Placeholders: {len(summary['image_placeholders'])}")
+            if VERBOSE:
+                lines.extend(f"    {title}: {desc}" for title, desc in summary["image_placeholders"])
+        if summary.get("balance_sheet_slide"):
+            bs = summary["balance_sheet_slide"]
+            lines.append(f"  Balance Sheet Slide: Chart={bs['has_chart']} ({bs['chart_type']}), Table={bs['has_table']}, Image={bs['has_image']}")
+    times = result["times"]
+    lines.append(f"  Times: Content={times['content']:.2f}s, PPT={times['ppt']:.2f}s, Total={times['total']:.2f}s")
+    return "\n".join(lines) + "\n"
+
+def _run_case(case, file_suffix, index, done):
+    """Run one test case, queueing (index, result, output, error) for the main thread"""
+    # Buffer this case's output so the main thread writes it in one go and concurrent cases don't interleave
+    buf = io.StringIO()
+    try:
+        result = _evaluate_case(case, file_suffix, buf)
+        buf.write(_format_case_report(result))
+        done.put((index, result, buf.getvalue(), None))
+    except BaseException as e:
+        done.put((index, None, buf.getvalue(), e))
+
 def test_thorough_visuals():
     """Thorough test for visual enhancements with focus on remaining areas"""
     test_cases = [
@@ -58,126 +261,41 @@ def test_thorough_visuals():
         }
     ]
     
-    results = []
-    import time
-    for case in test_cases:
-        print(f"\n=== Testing {case['name']} ===")
-        start_time = time.time()
-        
-        # Generate content
-        content = content_generator.generate_presentation_content(
-            topic=case["topic"],
-            presentation_type=case["presentation_type"],
-            target_audience=case["target_audience"],
-            slide_count=case["slide_count"],
-            include_real_data=case["include_real_data"],
-            content_provider="SerpAPI"
-        )
-        
-        generation_time = time.time() - start_time
-        print(f"Content generation time: {generation_time:.2f}s")
-        
-        if not content:
-            results.append({"case": case["name"], "status": "FAILED - No content generated", "time": generation_time})
-            continue
-        
-        # Analyze content visuals with enhanced checks
-        visual_summary = {
-            "total_slides": len(content.get("slides", [])),
-            "slides_with_charts": 0,
-            "slides_with_tables": 0,
-            "slides_with_images": 0,
-            "pie_charts": 0,
-            "bar_charts": 0,
-            "line_charts": 0,
-            "balance_pie": False,
-            "risk_pie": False,
-            "competitive_pie": False,
-            "revenue_table": False,
-            "performance_table": False,
-            "balance_table": False,
-            "image_placeholders": [],
-            "balance_sheet_slide": None
-        }
-        
-        for slide in content["slides"]:
-            title_lower = slide["title"].lower()
-            vs = slide.get("visual_suggestion", {})
-            if vs:
-                visual_summary["slides_with_charts"] += 1
-                chart_type = vs.get("chart_type", "")
-                if chart_type == "pie":
-                    visual_summary["pie_charts"] += 1
-                    if "balance" in title_lower:
-                        visual_summary["balance_pie"] = True
-                    if "risk" in title_lower or "volatility" in title_lower or "assessment" in title_lower:
-                        visual_summary["risk_pie"] = True
-                    if "competitive" in title_lower or "market position" in title_lower or "position" in title_lower:
-                        visual_summary["competitive_pie"] = True
-                elif chart_type == "bar":
-                    visual_summary["bar_charts"] += 1
-                elif chart_type == "line":
-                    visual_summary["line_charts"] += 1
-            
-            if slide.get("table_data"):
-                visual_summary["slides_with_tables"] += 1
-                if "revenue" in title_lower or "profitability" in title_lower:
-                    visual_summary["revenue_table"] = True
-                if "performance" in title_lower:
-                    visual_summary["performance_table"] = True
-                if "balance" in title_lower:
-                    visual_summary["balance_table"] = True
-            
-            if slide.get("image_suggestion"):
-                visual_summary["slides_with_images"] += 1
-                img_desc = slide["image_suggestion"].get("description", "")
-                visual_summary["image_placeholders"].append(f"{slide['title']}: {img_desc}")
-            
-            # Specific balance sheet check
-            if "balance sheet" in title_lower or "balance" in title_lower:
-                visual_summary["balance_sheet_slide"] = {
-                    "title": slide["title"],
-                    "has_chart": bool(vs),
-                    "chart_type": vs.get("chart_type") if vs else None,
-                    "has_table": bool(slide.get("table_data")),
-                    "has_image": bool(slide.get("image_suggestion"))
-                }
-        
-        # Generate PPT with timing
-        ppt_start = time.time()
+    results = [None] * len(test_cases)
+    # One timestamp per run plus a counter: concurrent cases can't collide on a second
+    base_ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+    counter = itertools.count()
+    # Handshake with SerpAPI once before the cases start searching
+    content_generator.warmup()
+    # Cases share no mutable state and mostly wait on SerpAPI, so run them all at once.
+    # Daemon threads: a stuck case can't keep the process alive once the summary is printed
+    done = queue.Queue()
+    for i, case in enumerate(test_cases):
+        threading.Thread(
+            target=_run_case, args=(case, f"{base_ts}_{next(counter)}", i, done), daemon=True
+        ).start()
+    deadline = time.perf_counter() + CASE_TIMEOUT
+    for _ in test_cases:
         try:
-            ppt_bytes = ppt_generator.create_presentation(
-                content=content,
-                template=case["template"],
-                include_charts=True
-            )
-            ppt_time = time.time() - ppt_start
-            print(f"PPT generation time: {ppt_time:.2f}s")
-            
-            if ppt_bytes:
-                sanitized_topic = case["topic"].replace(" ", "_")[:20]
-                filename = f"test_{sanitized_topic}_{case['presentation_type']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pptx"
-                ppt_file = ppt_generator.save_presentation(ppt_bytes, filename)
-                
-                visual_summary["ppt_generated"] = True
-                visual_summary["ppt_file"] = ppt_file
-                print(f"PPT generated successfully: {ppt_file}")
-            else:
-                visual_summary["ppt_generated"] = False
-                print("PPT generation failed")
-        except Exception as e:
-            visual_summary["ppt_generated"] = False
-            visual_summary["error"] = str(e)
-            print(f"PPT generation error: {e}")
-            ppt_time = 0
-        
-        total_time = time.time() - start_time
-        results.append({
-            "case": case["name"],
-            "status": "PASSED" if visual_summary.get("ppt_generated", False) else "FAILED",
-            "visual_summary": visual_summary,
-            "times": {"content": generation_time, "ppt": ppt_time, "total": total_time}
-        })
+            i, result, output, error = done.get(timeout=max(0, deadline - time.perf_counter()))
+        except queue.Empty:
+            break
+        sys.stdout.write(output)
+        sys.stdout.flush()
+        if error is not None:
+            raise error
+        results[i] = result
+    
+    # A stuck case is reported as failed rather than stalling the whole run; its output is dropped
+    for i, result in enumerate(results):
+        if result is None:
+            results[i] = {
+                "case": test_cases[i]["name"],
+                "status": "FAILED - timeout",
+                "visual_summary": None,
+                "times": {"content": CASE_TIMEOUT, "ppt": 0, "total": CASE_TIMEOUT}
+            }
+            print(_format_case_report(results[i]), end="")
     
     # Overall summary with enhanced details
     print("\n=== OVERALL TEST SUMMARY ===")
@@ -190,21 +308,6 @@ def test_thorough_visuals():
     print(f"Average Content Time: {total_content_time/total:.2f}s")
     print(f"Average PPT Time: {total_ppt_time/total:.2f}s")
     
-    for result in results:
-        print(f"\n{result['case']}: {result['status']}")
-        summary = result["visual_summary"]
-        print(f"  Charts: {summary['slides_with_charts']}/{summary['total_slides']}")
-        print(f"  Tables: {summary['slides_with_tables']}")
-        print(f"  Images: {summary['slides_with_images']}")
-        print(f"  Pie Charts: {summary['pie_charts']} (Balance: {summary['balance_pie']}, Risk: {summary['risk_pie']}, Competitive: {summary['competitive_pie']})")
-        print(f"  Revenue Table: {summary['revenue_table']}, Performance: {summary['performance_table']}, Balance: {summary['balance_table']}")
-        if summary.get("image_placeholders"):
-            print(f"  Image Placeholders: {len(summary['image_placeholders'])}")
-        if summary.get("balance_sheet_slide"):
-            bs = summary["balance_sheet_slide"]
-            print(f"  Balance Sheet Slide: Chart={bs['has_chart']} ({bs['chart_type']}), Table={bs['has_table']}, Image={bs['has_image']}")
-        print(f"  Times: Content={result['times']['content']:.2f}s, PPT={result['times']['ppt']:.2f}s, Total={result['times']['total']:.2f}s")
-    
     # App integration note (manual verification needed)
     print("\n=== APP INTEGRATION NOTE ===")
     print("For full app.py integration, run 'streamlit run app.py' and generate a PPT via UI.")